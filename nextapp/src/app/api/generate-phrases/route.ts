@@ -23,6 +23,31 @@ export interface PhraseGenerationResult {
   estimatedPracticeTime: number
 }
 
+const MAX_REQUEST_BYTES = 16 * 1024
+
+// Read the request body as text, or return null once it exceeds maxBytes
+async function readBodyWithLimit(request: NextRequest, maxBytes: number): Promise<string | null> {
+  if (!request.body) return ""
+
+  const reader = request.body.getReader()
+  const decoder = new TextDecoder()
+  let received = 0
+  let text = ""
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    received += value.byteLength
+    if (received > maxBytes) {
+      await reader.cancel()
+      return null
+    }
+    text += decoder.decode(value, { stream: true })
+  }
+
+  return text + decoder.decode()
+}
+
 export async function POST(request: NextRequest) {
   try {
     const apiKey = process.env.GEMINI_API_KEY
@@ -35,7 +60,19 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    const body: PhraseGenerationRequest = await request.json()
+    // Requests are a handful of short fields; refuse anything larger before parsing it.
+    // Content-Length is the fast path, but chunked bodies don't carry it, so the
+    // cap is also enforced while reading.
+    const contentLength = Number(request.headers.get("content-length") || 0)
+    const rawBody = contentLength > MAX_REQUEST_BYTES ? null : await readBodyWithLimit(request, MAX_REQUEST_BYTES)
+    if (rawBody === null) {
+      return NextResponse.json(
+        { error: "Request body too large" },
+        { status: 413 }
+      )
+    }
+
+    const body: PhraseGenerationRequest = JSON.parse(rawBody)
     const { language, weakPhonemes, difficultyLevel, currentScore, focusAreas } = body
 
     const prompt = buildPrompt(body)
@@ -86,7 +123,6 @@ export async function POST(request: NextRequest) {
 
     const data = await response.json()
     console.log("Gemini API response received successfully")
-    console.log("Response structure:", JSON.stringify(data, null, 2))
 
     if (data.candidates && data.candidates[0] && data.candidates[0].content && data.candidates[0].content.parts && data.candidates[0].content.parts[0]) {
       const text = data.candidates[0].content.parts[0].text
@@ -133,11 +169,21 @@ export async function POST(request: NextRequest) {
   }
 }
 
+// Map difficulty level to numeric complexity
+const COMPLEXITY_MAP = { beginner: 2, intermediate: 5, advanced: 8 }
+
+// Maximum complexity level for each description, lowest first
+const DIFFICULTY_DESCRIPTIONS: Array<[number, string]> = [
+  [2, "EXTREMELY EASY: 2-3 simple words only (cat, dog, red car)"],
+  [4, "VERY EASY: 3-4 words, basic vocabulary (big red car, small dog runs)"],
+  [6, "EASY: 4-6 words, common words (The big red car runs fast)"],
+  [8, "MODERATE: 6-8 words, some longer words (The beautiful red car drives through the city)"],
+]
+
 function getDifficultyDescription(level: number): string {
-  if (level <= 2) return "EXTREMELY EASY: 2-3 simple words only (cat, dog, red car)"
-  if (level <= 4) return "VERY EASY: 3-4 words, basic vocabulary (big red car, small dog runs)"
-  if (level <= 6) return "EASY: 4-6 words, common words (The big red car runs fast)"
-  if (level <= 8) return "MODERATE: 6-8 words, some longer words (The beautiful red car drives through the city)"
+  for (const [max, description] of DIFFICULTY_DESCRIPTIONS) {
+    if (level <= max) return description
+  }
   return "HARD: 8+ words, complex vocabulary, longer sentences (The magnificent red automobile accelerates through the bustling metropolitan area)"
 }
 
@@ -145,9 +191,7 @@ function buildPrompt(request: PhraseGenerationRequest): string {
   const { language, weakPhonemes, difficultyLevel, currentScore, focusAreas } = request
 
   const phonemeList = weakPhonemes.join(", ")
-  // Map difficulty level to numeric complexity
-  const complexityMap = { beginner: 2, intermediate: 5, advanced: 8 }
-  const complexityLevel = complexityMap[difficultyLevel] || 5
+  const complexityLevel = COMPLEXITY_MAP[difficultyLevel] || 5
   const difficultyDescription = getDifficultyDescription(complexityLevel)
   
   return `Generate 3 practice sentences in ${language}. Target phonemes: ${phonemeList}.
@@ -16,12 +16,101 @@ function loadScript(src: string) {
   });
 }
 
+/** Sorted unique landmark indices referenced by FACEMESH_LIPS (computed once) */
+let lipIndicesCache: Int32Array | null = null;
+function getLipIndices(FACEMESH_LIPS: Array<[number, number]>): Int32Array {
+  if (lipIndicesCache) return lipIndicesCache;
+  const set = new Set<number>();
+  for (const [a, b] of FACEMESH_LIPS) {
+    set.add(a);
+    set.add(b);
+  }
+  lipIndicesCache = Int32Array.from(set.values()).sort();
+  return lipIndicesCache;
+}
+
 type Landmark = { x: number; y: number };
+
+/** Upper bound on buffered lip frames per recording (~2 minutes at 30fps) */
+const MAX_LIP_FRAMES = 3600;
+
+/** Pack landmark x/y into a flat Float32Array for compact per-frame storage; reuses `out` when it fits */
+function packLandmarks(landmarks: Landmark[], out?: Float32Array): Float32Array {
+  const coords = out && out.length === landmarks.length * 2 ? out : new Float32Array(landmarks.length * 2);
+  for (let i = 0; i < landmarks.length; i++) {
+    coords[i * 2] = landmarks[i].x;
+    coords[i * 2 + 1] = landmarks[i].y;
+  }
+  return coords;
+}
+
+/** Centroid and extent of the lip landmarks, gathered in a single pass */
+function measureLips(coords: Float32Array, lipIndices: Int32Array) {
+  let sumX = 0;
+  let sumY = 0;
+  let minX = Infinity;
+  let maxX = -Infinity;
+  let minY = Infinity;
+  let maxY = -Infinity;
+  let n = 0;
+  for (let k = 0; k < lipIndices.length; k++) {
+    const idx = lipIndices[k];
+    if (idx * 2 + 1 >= coords.length) continue;
+    const x = coords[idx * 2];
+    const y = coords[idx * 2 + 1];
+    sumX += x;
+    sumY += y;
+    if (x < minX) minX = x;
+    if (x > maxX) maxX = x;
+    if (y < minY) minY = y;
+    if (y > maxY) maxY = y;
+    n++;
+  }
+  if (n === 0) return { cx: 0, cy: 0, width: 0, height: 0 };
+  return { cx: sumX / n, cy: sumY / n, width: maxX - minX, height: maxY - minY };
+}
+
+/** Draw the lip outline centred and scaled to fill a W x H canvas */
+function drawIsolatedLips(
+  ctx: CanvasRenderingContext2D,
+  W: number,
+  H: number,
+  coords: Float32Array,
+  FACEMESH_LIPS: Array<[number, number]>
+) {
+  const margin = 40;
+
+  // Compute centroid & scale (normalized [0..1] -> canvas)
+  const { cx, cy, width, height } = measureLips(coords, getLipIndices(FACEMESH_LIPS));
+  const mouthW = Math.max(0.001, width);
+  const mouthH = Math.max(0.001, height);
+  const availW = W - margin * 2;
+  const availH = H - margin * 2;
+  const scale = Math.min(availW / mouthW, availH / mouthH) * 0.85;
+
+  ctx.save();
+  ctx.lineWidth = 3;
+  ctx.strokeStyle = "#00FF00";
+  ctx.lineCap = "round";
+  ctx.lineJoin = "round";
+  // Only the lip connectors are drawn, so transform just their endpoints
+  // instead of mapping every face landmark each frame
+  const ox = W / 2 - cx * scale;
+  const oy = H / 2 - cy * scale;
+  // Batch every connector into one path so the canvas strokes once per frame
+  ctx.beginPath();
+  for (const [a, b] of FACEMESH_LIPS) {
+    if (a * 2 + 1 >= coords.length || b * 2 + 1 >= coords.length) continue;
+    ctx.moveTo(coords[a * 2] * scale + ox, coords[a * 2 + 1] * scale + oy);
+    ctx.lineTo(coords[b * 2] * scale + ox, coords[b * 2 + 1] * scale + oy);
+  }
+  ctx.stroke();
+  ctx.restore();
+}
+
 type LipFrame = {
-  /** normalized [0..1] points (x,y) for stable outline playback */
-  points: Array<[number, number]>;
-  /** full landmarks for connector-accurate playback */
-  landmarks: Landmark[];
+  /** normalized [0..1] landmark coords packed as x0,y0,x1,y1,... for connector-accurate playback */
+  coords: Float32Array;
   /** timestamp in ms relative to recording start */
   t: number;
 };
@@ -38,9 +127,11 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
   // --- live capture ---
   const videoRef = useRef<HTMLVideoElement>(null);
   const liveCanvasRef = useRef<HTMLCanvasElement>(null);
+  const cameraRef = useRef<any>(null); // MediaPipe Camera, restarted when the page becomes visible again
 
   // --- recording (video+audio) ---
   const [isRecording, setIsRecording] = useState(false);
+  const isRecordingRef = useRef(false); // read by the long-lived FaceMesh callback
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
   const recordedChunksRef = useRef<Blob[]>([]);
   const [recordedUrl, setRecordedUrl] = useState<string | null>(null);
@@ -54,14 +145,13 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
 
   // --- isolated playback (outline + video sync) ---
   const isoCanvasRef = useRef<HTMLCanvasElement>(null);
+  const liveCoordsRef = useRef<Float32Array | null>(null); // scratch buffer for live redraws
   const videoPlaybackRef = useRef<HTMLVideoElement>(null);
   const currentVideoUrlRef = useRef<string | null>(null);
   const [isoIndex, setIsoIndex] = useState(0);
   const [isPlayingIso, setIsPlayingIso] = useState(false);
 
   // --- volume monitoring ---
-  const volumeBarRef = useRef<HTMLDivElement>(null);
-  const [volume, setVolume] = useState(0);
   const rafRef = useRef<number | null>(null);
 
   // --- status text ---
@@ -76,7 +166,11 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
     // Get the actual video dimensions
     const vw = v.videoWidth;
     const vh = v.videoHeight;
-    
+
+    // Called for every FaceMesh result; assigning width/height reallocates the
+    // canvas backing store even when unchanged, so only resize on a real change
+    if (c.width === vw && c.height === vh) return;
+
     // Set canvas to match video exactly
     c.width = vw;
     c.height = vh;
@@ -211,7 +305,6 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
     (async () => {
       try {
         const base = "https://cdn.jsdelivr.net/npm/@mediapipe";
-        await loadScript(`${base}/drawing_utils/drawing_utils.js`);
         await loadScript(`${base}/camera_utils/camera_utils.js`);
         await loadScript(`${base}/face_mesh/face_mesh.js`);
         await new Promise((r) => setTimeout(r, 250));
@@ -258,35 +351,30 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
             ctx.lineCap = "round";
             ctx.lineJoin = "round";
 
-            // Debug: log first few lip points
-            if (landmarks && landmarks.length > 0) {
-              const firstLip = landmarks[FACEMESH_LIPS[0][0]];
-              // Lip tracking active
-            }
-
+            // Single path for all connectors, stroked once
+            ctx.beginPath();
             for (const [a, b] of FACEMESH_LIPS) {
               const p1 = landmarks[a];
               const p2 = landmarks[b];
               if (!p1 || !p2) continue;
-              ctx.beginPath();
               // Use normalized coordinates directly (MediaPipe gives 0-1 range)
               ctx.moveTo(p1.x * vw, p1.y * vh);
               ctx.lineTo(p2.x * vw, p2.y * vh);
-              ctx.stroke();
             }
+            ctx.stroke();
 
             setStatus("Face detected — lips tracking active");
 
             // While recording, stash timestamped frame with throttling for better performance
-            if (isRecording) {
+            if (isRecordingRef.current) {
               const t = performance.now() - recStartRef.current;
               const lastFrame = lipFramesRef.current[lipFramesRef.current.length - 1];
               const timeSinceLastFrame = t - (lastFrame?.t || 0);
               
-              // Throttle to ~30fps to reduce processing overhead
-              if (timeSinceLastFrame > 33) {
-                const pts = extractUniqueLipPoints(landmarks, FACEMESH_LIPS);
-                lipFramesRef.current.push({ points: pts, landmarks, t });
+              // Throttle to ~30fps to reduce processing overhead, and stop
+              // buffering once the cap is reached (playback holds the last frame)
+              if (timeSinceLastFrame > 33 && lipFramesRef.current.length < MAX_LIP_FRAMES) {
+                lipFramesRef.current.push({ coords: packLandmarks(landmarks), t });
               }
             }
           } else {
@@ -309,6 +397,7 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
           height: 480,
         });
 
+        cameraRef.current = cameraInstance;
         await cameraInstance.start();
         setStatus("Camera ready");
       } catch (e) {
@@ -324,9 +413,12 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
         stream?.getTracks().forEach((t) => t.stop());
         cameraInstance?.stop?.();
       } catch {}
+      cameraRef.current = null;
     };
+    // Set up once: recording state is read through isRecordingRef so toggling
+    // it doesn't tear down and re-initialise the camera and FaceMesh
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [isRecording]);
+  }, []);
 
   // Cleanup camera and microphone when page becomes hidden or user navigates away
   useEffect(() => {
@@ -336,10 +428,21 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
         try {
           const stream = (videoRef.current?.srcObject as MediaStream) || null;
           stream?.getTracks().forEach((t) => t.stop());
+          cameraRef.current?.stop?.();
           setStatus("Camera stopped (page hidden)");
         } catch (error) {
           console.error("Error stopping camera on visibility change:", error);
         }
+      } else if (cameraRef.current) {
+        // Page is visible again; the FaceMesh pipeline is set up once, so
+        // restart the camera stream it reads from
+        cameraRef.current
+          .start()
+          .then(() => setStatus("Camera ready"))
+          .catch((error: unknown) => {
+            console.error("Error restarting camera on visibility change:", error);
+            setStatus("Could not start camera (HTTPS + permission required)");
+          });
       }
     };
 
@@ -401,7 +504,7 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
         return;
       }
       const videoTrack = camStream.getVideoTracks()[0];
-      if (!videoTrack) {
+      if (!videoTrack || videoTrack.readyState === "ended") {
         setStatus("No video track");
         return;
       }
@@ -431,6 +534,7 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
       console.log('Starting MediaRecorder...');
       recorder.start(100); // collect chunks
 
+      isRecordingRef.current = true;
       setIsRecording(true);
       console.log('Recording started successfully');
       setStatus("Recording…");
@@ -438,6 +542,7 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
       mediaRecorderRef.current?.stop();
       micStreamRef.current?.getTracks().forEach((t) => t.stop());
       micStreamRef.current = null;
+      isRecordingRef.current = false;
       setIsRecording(false);
       setStatus("Recording stopped");
     }
@@ -461,8 +566,7 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
         analyser.getByteFrequencyData(dataArray);
         const average = dataArray.reduce((a, b) => a + b) / dataArray.length;
         const volumePercent = (average / 255) * 100;
-        setVolume(volumePercent);
-        
+
         // Update the volume bar
         const volumeBar = document.getElementById('volume-bar');
         if (volumeBar) {
@@ -645,107 +749,20 @@ const LipReader = forwardRef<LipReaderRef>((props, ref) => {
 
     ctx.clearRect(0, 0, c.width, c.height);
 
-    // If we have recorded frames and are playing, show the current frame
+    // Recorded frame while playing back, otherwise the live landmarks
     const frame = lipFramesRef.current[isoIndex];
+    let coords: Float32Array | null = null;
     if (frame && isPlayingIso) {
-      const win = window as any;
-      const FACEMESH_LIPS: Array<[number, number]> = win.FACEMESH_LIPS;
-      const W = c.width;
-      const H = c.height;
-      const margin = 40;
-
-      // Compute centroid & scale (normalized [0..1] -> canvas)
-      const cx = frame.points.reduce((s, p) => s + p[0], 0) / Math.max(1, frame.points.length);
-      const cy = frame.points.reduce((s, p) => s + p[1], 0) / Math.max(1, frame.points.length);
-      const xs = frame.points.map((p) => p[0]);
-      const ys = frame.points.map((p) => p[1]);
-      const mouthW = Math.max(0.001, Math.max(...xs) - Math.min(...xs));
-      const mouthH = Math.max(0.001, Math.max(...ys) - Math.min(...ys));
-      const availW = W - margin * 2;
-      const availH = H - margin * 2;
-      const scale = Math.min(availW / mouthW, availH / mouthH) * 0.85;
-
-      const scaled = frame.landmarks.map((p) => ({
-        x: (p.x - cx) * scale + W / 2,
-        y: (p.y - cy) * scale + H / 2,
-      }));
-
-      ctx.save();
-      ctx.lineWidth = 3;
-      ctx.strokeStyle = "#00FF00";
-      ctx.lineCap = "round";
-      ctx.lineJoin = "round";
-      for (const [a, b] of FACEMESH_LIPS) {
-        const p1 = scaled[a];
-        const p2 = scaled[b];
-        if (!p1 || !p2) continue;
-        ctx.beginPath();
-        ctx.moveTo(p1.x, p1.y);
-        ctx.lineTo(p2.x, p2.y);
-        ctx.stroke();
-      }
-      ctx.restore();
+      coords = frame.coords;
     } else if (currentLandmarks && !isPlayingIso) {
-      // Show live landmarks when not playing back
-      const win = window as any;
-      const FACEMESH_LIPS: Array<[number, number]> = win.FACEMESH_LIPS;
-      const W = c.width;
-      const H = c.height;
-      const margin = 40;
-
-      // Compute centroid & scale for live landmarks
-      const lipPoints = extractUniqueLipPoints(currentLandmarks, FACEMESH_LIPS);
-      const cx = lipPoints.reduce((s, p) => s + p[0], 0) / Math.max(1, lipPoints.length);
-      const cy = lipPoints.reduce((s, p) => s + p[1], 0) / Math.max(1, lipPoints.length);
-      const xs = lipPoints.map((p) => p[0]);
-      const ys = lipPoints.map((p) => p[1]);
-      const mouthW = Math.max(0.001, Math.max(...xs) - Math.min(...xs));
-      const mouthH = Math.max(0.001, Math.max(...ys) - Math.min(...ys));
-      const availW = W - margin * 2;
-      const availH = H - margin * 2;
-      const scale = Math.min(availW / mouthW, availH / mouthH) * 0.85;
-
-      const scaled = currentLandmarks.map((p) => ({
-        x: (p.x - cx) * scale + W / 2,
-        y: (p.y - cy) * scale + H / 2,
-      }));
-
-      ctx.save();
-      ctx.lineWidth = 3;
-      ctx.strokeStyle = "#00FF00";
-      ctx.lineCap = "round";
-      ctx.lineJoin = "round";
-      for (const [a, b] of FACEMESH_LIPS) {
-        const p1 = scaled[a];
-        const p2 = scaled[b];
-        if (!p1 || !p2) continue;
-        ctx.beginPath();
-        ctx.moveTo(p1.x, p1.y);
-        ctx.lineTo(p2.x, p2.y);
-        ctx.stroke();
-      }
-      ctx.restore();
+      // Live landmarks are drawn and discarded, so pack them into a reused buffer
+      coords = liveCoordsRef.current = packLandmarks(currentLandmarks, liveCoordsRef.current ?? undefined);
     }
-  }, [isoIndex, isPlayingIso, currentLandmarks]);
+    if (!coords) return;
 
-  // Utilities
-  function extractUniqueLipPoints(
-    landmarks: Array<{ x: number; y: number }>,
-    FACEMESH_LIPS: Array<[number, number]>
-  ): Array<[number, number]> {
-    const set = new Set<number>();
-    for (const [a, b] of FACEMESH_LIPS) {
-      set.add(a);
-      set.add(b);
-    }
-    const ordered = Array.from(set.values()).sort((a, b) => a - b);
-    const pts: Array<[number, number]> = [];
-    for (const idx of ordered) {
-      const p = landmarks[idx];
-      if (p) pts.push([p.x, p.y]);
-    }
-    return pts;
-  }
+    const win = window as any;
+    drawIsolatedLips(ctx, c.width, c.height, coords, win.FACEMESH_LIPS);
+  }, [isoIndex, isPlayingIso, currentLandmarks]);
 
   return (
     <div className="w-full">
@@ -28,9 +28,13 @@ export interface ProgressStats {
 }
 
 export class ProgressTracker {
+  // Kept oldest-first; readers that need another order sort a copy
   private sessions: SessionData[] = []
   private readonly STORAGE_KEY = "pronunciation_progress"
   private currentUserId: string | null = null
+  // Cached result of getProgressStats (minus the date-dependent streak),
+  // cleared whenever sessions change
+  private statsCache: Omit<ProgressStats, "streakDays"> | null = null
 
   constructor() {
     this.loadFromStorage()
@@ -81,6 +85,7 @@ export class ProgressTracker {
 
     console.log('Created session:', session)
     this.sessions.push(session)
+    this.statsCache = null
     console.log('Total sessions now:', this.sessions.length)
     
     if (this.currentUserId) {
@@ -101,10 +106,18 @@ export class ProgressTracker {
   }
 
   getRecentSessions(limit = 10): SessionData[] {
-    return this.sessions.sort((a, b) => b.timestamp.getTime() - a.timestamp.getTime()).slice(0, limit)
+    return [...this.sessions].sort((a, b) => b.timestamp.getTime() - a.timestamp.getTime()).slice(0, limit)
   }
 
   getProgressStats(): ProgressStats {
+    // The dashboard reloads on both progressUpdated and sessionAdded, so reuse
+    // the last result until the session list changes. The streak depends on
+    // today's date, so it is recomputed on every call.
+    if (!this.statsCache) this.statsCache = this.computeProgressStats()
+    return { ...this.statsCache, streakDays: this.calculateStreakDays() }
+  }
+
+  private computeProgressStats(): Omit<ProgressStats, "streakDays"> {
     if (this.sessions.length === 0) {
       return {
         totalSessions: 0,
@@ -116,7 +129,6 @@ export class ProgressTracker {
         phonemeAccuracy: {},
         languageBreakdown: {},
         recentTrend: "stable",
-        streakDays: 0,
       }
     }
 
@@ -190,8 +202,6 @@ export class ProgressTracker {
     const recentTrend: "improving" | "stable" | "declining" =
       trendSlope > 2 ? "improving" : trendSlope < -2 ? "declining" : "stable"
 
-    const streakDays = this.calculateStreakDays()
-
     return {
       totalSessions,
       averageScore: Math.round(averageScore),
@@ -202,7 +212,6 @@ export class ProgressTracker {
       phonemeAccuracy,
       languageBreakdown,
       recentTrend,
-      streakDays,
     }
   }
 
@@ -243,7 +252,7 @@ export class ProgressTracker {
     }
 
     // Get recent sessions (up to maxSessions)
-    const recentSessions = this.sessions
+    const recentSessions = [...this.sessions]
       .sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime())
       .slice(-maxSessions);
 
@@ -252,8 +261,9 @@ export class ProgressTracker {
     const improving: number[] = [];
     const needsWork: number[] = [];
 
-    // Track phoneme accuracy over time
-    const phonemeHistory: { [phoneme: string]: number[] } = {};
+    // Track phoneme accuracy over time as running totals so each session's
+    // averages don't re-sum the whole history
+    const phonemeHistory: { [phoneme: string]: { latest: number; sum: number; count: number } } = {};
 
     recentSessions.forEach((session, index) => {
       sessions.push(index + 1);
@@ -275,12 +285,15 @@ export class ProgressTracker {
       // Update phoneme history
       sessionPhonemes.forEach(phoneme => {
         if (!phonemeHistory[phoneme]) {
-          phonemeHistory[phoneme] = [];
+          phonemeHistory[phoneme] = { latest: 0, sum: 0, count: 0 };
         }
         // Use actual phoneme score if available, otherwise use overall score as fallback
         const phonemeScore = session.phonemeScores?.[phoneme] || session.overallScore;
         console.log(`Session ${index + 1}: Phoneme ${phoneme} = ${phonemeScore} (from ${session.phonemeScores?.[phoneme] ? 'phonemeScores' : 'overallScore'})`);
-        phonemeHistory[phoneme].push(phonemeScore);
+        const history = phonemeHistory[phoneme];
+        history.latest = phonemeScore;
+        history.sum += phonemeScore;
+        history.count++;
       });
 
       // Calculate mastery levels for this session
@@ -288,10 +301,10 @@ export class ProgressTracker {
       let improvingCount = 0;
       let needsWorkCount = 0;
 
-      Object.entries(phonemeHistory).forEach(([phoneme, scores]) => {
-        if (scores.length > 0) {
-          const latestScore = scores[scores.length - 1];
-          const avgScore = scores.reduce((a, b) => a + b, 0) / scores.length;
+      Object.entries(phonemeHistory).forEach(([phoneme, history]) => {
+        if (history.count > 0) {
+          const latestScore = history.latest;
+          const avgScore = history.sum / history.count;
           
           // Debug logging
           console.log(`Phoneme ${phoneme}: latest=${latestScore}, avg=${avgScore.toFixed(1)}`);
@@ -331,7 +344,7 @@ export class ProgressTracker {
   }
 
   getScoreHistoryBySessions(sessionCount = 30): Array<{ session: number; score: number; date: string }> {
-    const recentSessions = this.sessions
+    const recentSessions = [...this.sessions]
       .sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime())
       .slice(-sessionCount)
 
@@ -343,7 +356,7 @@ export class ProgressTracker {
   }
 
   getRecentPoorPhonemes(limit = 5): Array<{ phoneme: string; accuracy: number; sessionDate: Date }> {
-    const recentSessions = this.sessions
+    const recentSessions = [...this.sessions]
       .sort((a, b) => b.timestamp.getTime() - a.timestamp.getTime())
       .slice(0, limit);
 
@@ -381,7 +394,7 @@ export class ProgressTracker {
 
     switch (range) {
       case 'lifetime':
-        sessions = this.sessions.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
+        sessions = [...this.sessions].sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
         break;
       case '30days':
         const thirtyDaysAgo = new Date();
@@ -391,12 +404,12 @@ export class ProgressTracker {
           .sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime());
         break;
       case '30sessions':
-        sessions = this.sessions
+        sessions = [...this.sessions]
           .sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime())
           .slice(-30);
         break;
       case '10sessions':
-        sessions = this.sessions
+        sessions = [...this.sessions]
           .sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime())
           .slice(-10);
         break;
@@ -425,12 +438,15 @@ export class ProgressTracker {
     const today = new Date()
     today.setHours(0, 0, 0, 0)
 
+    // Quantize each session to its date key once instead of rescanning per day
+    const sessionDates = new Set(this.sessions.map((session) => session.timestamp.toISOString().split("T")[0]))
+
     let streak = 0
     const currentDate = new Date(today)
 
     while (true) {
       const dateStr = currentDate.toISOString().split("T")[0]
-      const hasSession = this.sessions.some((session) => session.timestamp.toISOString().split("T")[0] === dateStr)
+      const hasSession = sessionDates.has(dateStr)
 
       if (hasSession) {
         streak++
@@ -459,6 +475,8 @@ export class ProgressTracker {
             ...session,
             timestamp: new Date(session.timestamp),
           }))
+          this.sessions.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime())
+          this.statsCache = null
         } catch (error) {
           console.error("Failed to load progress data:", error)
         }
@@ -468,6 +486,7 @@ export class ProgressTracker {
 
   clearProgress() {
     this.sessions = []
+    this.statsCache = null
     this.saveToStorage()
     
     if (typeof window !== "undefined") {
@@ -478,12 +497,14 @@ export class ProgressTracker {
   clearAllData() {
     // Only clear local sessions, don't touch Supabase data
     this.sessions = []
+    this.statsCache = null
     this.currentUserId = null
     this.saveToStorage()
   }
 
   deleteSession(sessionId: string) {
     this.sessions = this.sessions.filter(session => session.id !== sessionId)
+    this.statsCache = null
     this.saveToStorage()
     
     if (typeof window !== "undefined") {
@@ -530,6 +551,9 @@ export class ProgressTracker {
         duration: session.session_duration || 0,
         userId: session.user_id
       }))
+      // Supabase returns newest-first; keep the oldest-first invariant
+      this.sessions.sort((a, b) => a.timestamp.getTime() - b.timestamp.getTime())
+      this.statsCache = null
 
       console.log('Converted sessions:', this.sessions.length)
 
@@ -119,6 +119,43 @@ const PHONEME_MAPS = {
   },
 }
 
+// Common mispronunciations used to simulate realistic transcription errors
+const COMMON_ERRORS = {
+  // TH sounds
+  the: ["ze", "da", "de"],
+  think: ["sink", "tink", "fink"],
+  three: ["tree", "free", "sree"],
+  this: ["dis", "zis", "tis"],
+
+  // R sounds
+  red: ["wed", "led", "ded"],
+  very: ["wery", "vely", "bery"],
+  water: ["vater", "wata", "vata"],
+
+  // L sounds
+  love: ["rove", "lobe", "lub"],
+  little: ["rittle", "litter", "littel"],
+
+  // Common mispronunciations
+  pronunciation: ["pronunciashun", "pronunsiation", "pronuncation"],
+  comfortable: ["comftable", "comfterble", "comfortible"],
+
+  // Consonant clusters
+  street: ["stweet", "steet", "streat"],
+  strong: ["stwong", "stong", "strung"],
+}
+
+// Basic grapheme -> phoneme patterns for common phonemes, checked in order
+const GRAPHEME_PHONEMES: Array<[string, string[]]> = [
+  ["th", ["θ", "ð"]],
+  ["sh", ["ʃ"]],
+  ["ch", ["tʃ"]],
+  ["r", ["r"]],
+  ["l", ["l"]],
+  ["w", ["w"]],
+  ["v", ["v"]],
+]
+
 // Mock speech recognition - in production, integrate with Web Speech API or cloud services
 export class SpeechAnalyzer {
   private language: string
@@ -181,32 +218,7 @@ export class SpeechAnalyzer {
   }
 
   private introduceRealisticError(word: string): string {
-    const commonErrors = {
-      // TH sounds
-      the: ["ze", "da", "de"],
-      think: ["sink", "tink", "fink"],
-      three: ["tree", "free", "sree"],
-      this: ["dis", "zis", "tis"],
-
-      // R sounds
-      red: ["wed", "led", "ded"],
-      very: ["wery", "vely", "bery"],
-      water: ["vater", "wata", "vata"],
-
-      // L sounds
-      love: ["rove", "lobe", "lub"],
-      little: ["rittle", "litter", "littel"],
-
-      // Common mispronunciations
-      pronunciation: ["pronunciashun", "pronunsiation", "pronuncation"],
-      comfortable: ["comftable", "comfterble", "comfortible"],
-
-      // Consonant clusters
-      street: ["stweet", "steet", "streat"],
-      strong: ["stwong", "stong", "strung"],
-    }
-
-    const errors = commonErrors[word as keyof typeof commonErrors]
+    const errors = COMMON_ERRORS[word as keyof typeof COMMON_ERRORS]
     if (errors) {
       return errors[Math.floor(Math.random() * errors.length)]
     }
@@ -277,36 +289,33 @@ export class SpeechAnalyzer {
   }
 
   private levenshteinDistance(str1: string, str2: string): number {
-    const matrix = Array(str2.length + 1)
-      .fill(null)
-      .map(() => Array(str1.length + 1).fill(null))
+    // Only the previous row is needed, so keep two rows instead of the full matrix
+    let prev = new Uint32Array(str1.length + 1)
+    let curr = new Uint32Array(str1.length + 1)
 
-    for (let i = 0; i <= str1.length; i++) matrix[0][i] = i
-    for (let j = 0; j <= str2.length; j++) matrix[j][0] = j
+    for (let i = 0; i <= str1.length; i++) prev[i] = i
 
     for (let j = 1; j <= str2.length; j++) {
+      curr[0] = j
       for (let i = 1; i <= str1.length; i++) {
         const indicator = str1[i - 1] === str2[j - 1] ? 0 : 1
-        matrix[j][i] = Math.min(matrix[j][i - 1] + 1, matrix[j - 1][i] + 1, matrix[j - 1][i - 1] + indicator)
+        curr[i] = Math.min(curr[i - 1] + 1, prev[i] + 1, prev[i - 1] + indicator)
       }
+      const tmp = prev
+      prev = curr
+      curr = tmp
     }
 
-    return matrix[str2.length][str1.length]
+    return prev[str1.length]
   }
 
   private extractPhonemes(word: string): string[] {
     // Simplified phoneme extraction - in production, use proper phonetic dictionaries
-    const phonemeMap = PHONEME_MAPS[this.language as keyof typeof PHONEME_MAPS] || PHONEME_MAPS.english
     const phonemes: string[] = []
 
-    // Basic pattern matching for common phonemes
-    if (word.includes("th")) phonemes.push("θ", "ð")
-    if (word.includes("sh")) phonemes.push("ʃ")
-    if (word.includes("ch")) phonemes.push("tʃ")
-    if (word.includes("r")) phonemes.push("r")
-    if (word.includes("l")) phonemes.push("l")
-    if (word.includes("w")) phonemes.push("w")
-    if (word.includes("v")) phonemes.push("v")
+    for (const [pattern, matched] of GRAPHEME_PHONEMES) {
+      if (word.includes(pattern)) phonemes.push(...matched)
+    }
 
     return phonemes
   }
@@ -384,9 +393,16 @@ export function getPhonemeInfo(phoneme: string, language = "english") {
   return phonemeMap[phoneme as keyof typeof phonemeMap]
 }
 
+// Minimum difficulty for each color, highest first
+const DIFFICULTY_COLORS: Array<[number, string]> = [
+  [8, "text-red-500"],
+  [6, "text-orange-500"],
+  [4, "text-yellow-500"],
+]
+
 export function getDifficultyColor(difficulty: number): string {
-  if (difficulty >= 8) return "text-red-500"
-  if (difficulty >= 6) return "text-orange-500"
-  if (difficulty >= 4) return "text-yellow-500"
+  for (const [min, color] of DIFFICULTY_COLORS) {
+    if (difficulty >= min) return color
+  }
   return "text-green-500"
 }